@@ -5,17 +5,19 @@ import sys
 import asyncio
 import logging
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 import traceback
 from datetime import datetime
 from utils.constants import (
     BOT_DESCRIPTION,
     COMMAND_PREFIX,
+    CONFIG_WATCH_INTERVAL,
     LOG_FORMAT,
     LOG_FILE
 )
+from utils.config import Config
 from utils.database import Database
 
 # Setup directories
@@ -62,8 +64,14 @@ class PULSEBot(commands.Bot):
         )
         
         self.db = Database()
+        self.config = Config()
         self.start_time = datetime.now()
 
+        # State shared across cog reloads
+        self.cooldowns: Dict[int, datetime] = {}
+        self.cog_mtimes: Dict[str, float] = {}
+        self.reload_lock = asyncio.Lock()
+
     async def setup_hook(self) -> None:
         """Initialize bot configuration"""
         logger.info("Loading cogs...")
@@ -71,6 +79,8 @@ class PULSEBot(commands.Bot):
         # Load all cogs
         for cog_file in COGS_DIR.glob("*.py"):
             if cog_file.stem != "__init__":
+                # Track every cog, including ones that fail, so the watcher can retry them
+                self.cog_mtimes[f"cogs.{cog_file.stem}"] = cog_file.stat().st_mtime
                 try:
                     await self.load_extension(f"cogs.{cog_file.stem}")
                     logger.info(f"Loaded cog: {cog_file.stem}")
@@ -85,6 +95,68 @@ class PULSEBot(commands.Bot):
             logger.info("Commands synced successfully")
         except Exception as e:
             logger.error(f"Failed to sync commands: {e}")
+
+        self.watch_config.start()
+
+    async def reload_runtime(self, force: bool = False) -> Tuple[List[str], Optional[str]]:
+        """Reload changed configuration and cogs in place.
+
+        Returns what was reloaded and the configuration error, if any. Cogs are
+        still reloaded when the configuration file is invalid.
+        """
+        reloaded = []
+        config_error = None
+        async with self.reload_lock:
+            if force or self.config.has_changed():
+                try:
+                    if self.config.reload():
+                        reloaded.append("configuration")
+                except ValueError as e:
+                    config_error = str(e)
+                    logger.error(f"Invalid configuration, keeping previous settings: {e}")
+
+            for cog_file in COGS_DIR.glob("*.py"):
+                if cog_file.stem == "__init__":
+                    continue
+                name = f"cogs.{cog_file.stem}"
+                try:
+                    current = cog_file.stat().st_mtime
+                except FileNotFoundError:
+                    continue
+
+                loaded = name in self.extensions
+                changed = self.cog_mtimes.get(name) != current
+                # Forced reloads also retry cogs that failed to load earlier
+                if not changed and (loaded or not force):
+                    continue
+
+                # Record the mtime first so a broken cog is only retried after the next edit
+                self.cog_mtimes[name] = current
+                try:
+                    if loaded:
+                        await self.reload_extension(name)
+                        logger.info(f"Reloaded cog: {name}")
+                    else:
+                        await self.load_extension(name)
+                        logger.info(f"Loaded cog: {name}")
+                    reloaded.append(name)
+                except Exception as e:
+                    logger.error(f"Failed to load cog {name}, keeping previous version: {e}")
+
+        return reloaded, config_error
+
+    @tasks.loop(seconds=CONFIG_WATCH_INTERVAL)
+    async def watch_config(self):
+        """Apply configuration and cog changes as soon as they land on disk"""
+        try:
+            await self.reload_runtime()
+        except Exception as e:
+            logger.error(f"Failed to reload configuration: {e}")
+
+    async def close(self) -> None:
+        """Stop the config watcher before shutting down"""
+        self.watch_config.cancel()
+        await super().close()
             
     async def on_ready(self):
         """Handle bot ready event"""
@@ -6,8 +6,6 @@ from discord.ext import commands
 from datetime import datetime
 import logging
 from typing import Dict, Optional
-from utils.constants import ROLE_HIERARCHY, RoleLevel, DEFAULT_COOLDOWN
-from utils.database import Database
 
 logger = logging.getLogger('PULSE.emergency')
 
@@ -31,17 +29,13 @@ class SOSModal(discord.ui.Modal):
         self.add_item(self.reason)
 
     async def on_submit(self, interaction: discord.Interaction):
-        cog = interaction.client.get_cog('EmergencyCog')
-        if not cog:
-            await interaction.response.send_message(
-                "⚠️ System error. Please try again later.",
-                ephemeral=True
-            )
-            return
+        # Use bot-level state rather than the cog, so alerts submitted while
+        # the cog is being reloaded are still delivered
+        bot = interaction.client
 
         try:
             # Get alert channel
-            alert_channel_id = cog.db.get_config('alert_channel')
+            alert_channel_id = bot.db.get_config('alert_channel')
             if not alert_channel_id:
                 await interaction.response.send_message(
                     "⚠️ Alert channel not configured. Please contact an administrator.",
@@ -78,7 +72,7 @@ class SOSModal(discord.ui.Modal):
             )
 
             # Log alert
-            cog.db.log_alert(
+            bot.db.log_alert(
                 interaction.user.id,
                 self.location.value,
                 self.reason.value,
@@ -86,7 +80,7 @@ class SOSModal(discord.ui.Modal):
             )
 
             # Set cooldown
-            cog.cooldowns[interaction.user.id] = datetime.now()
+            bot.cooldowns[interaction.user.id] = datetime.now()
 
             await interaction.response.send_message(
                 "🚨 Emergency alert posted successfully.\n"
@@ -105,26 +99,25 @@ class SOSModal(discord.ui.Modal):
 class EmergencyCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.db = Database()
-        self.cooldowns: Dict[int, datetime] = {}
+        self.db = bot.db
+        # Owned by the bot so cooldowns survive cog reloads
+        self.cooldowns: Dict[int, datetime] = bot.cooldowns
 
     def check_cooldown(self, user_id: int) -> tuple[bool, float]:
         """Check if a user is on cooldown"""
+        cooldown = self.bot.config.settings.default_cooldown
         if user_id in self.cooldowns:
             elapsed = (datetime.now() - self.cooldowns[user_id]).total_seconds()
-            if elapsed < DEFAULT_COOLDOWN:
-                return True, DEFAULT_COOLDOWN - elapsed
+            if elapsed < cooldown:
+                return True, cooldown - elapsed
         return False, 0
 
     @app_commands.command(name="sos", description="Send an emergency alert")
     async def sos(self, interaction: discord.Interaction):
         # Check user roles
-        user_roles = [role.name for role in interaction.user.roles]
+        authorized_roles = self.bot.config.settings.authorized_roles
         
-        if not any(role in sum(
-            [roles for level, roles in ROLE_HIERARCHY.items() 
-             if level != RoleLevel.RESTRICTED], []
-        ) for role in user_roles):
+        if not any(role.name in authorized_roles for role in interaction.user.roles):
             logger.warning(f"User {interaction.user.name} attempted to use SOS without proper role")
             await interaction.response.send_message(
                 "⚠️ You must be an authorized member to use the emergency alert system.",
@@ -6,14 +6,13 @@ from discord.ext import commands
 import logging
 from typing import List
 from utils.constants import ROLE_HIERARCHY, RoleLevel
-from utils.database import Database
 
 logger = logging.getLogger('PULSE.setup')
 
 class SetupCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.db = Database()
+        self.db = bot.db
 
     @staticmethod
     def check_permissions(channel: discord.TextChannel, bot_member: discord.Member) -> List[str]:
@@ -86,6 +85,38 @@ class SetupCog(commands.Cog):
                 ephemeral=True
             )
 
+    @app_commands.command(name="pulse-reload", description="Reload PULSE configuration and changed modules")
+    async def pulse_reload(self, interaction: discord.Interaction):
+        """Apply configuration and cog changes without restarting the bot"""
+        # Check if user has Magnate role
+        if not any(role.name == 'Magnate' for role in interaction.user.roles):
+            await interaction.response.send_message(
+                "⚠️ Only Magnate can reload the system configuration.",
+                ephemeral=True
+            )
+            return
+
+        try:
+            reloaded, config_error = await self.bot.reload_runtime(force=True)
+        except Exception as e:
+            logger.error(f"Failed to reload configuration: {e}")
+            await interaction.response.send_message(
+                "⚠️ Failed to reload configuration. Please try again.",
+                ephemeral=True
+            )
+            return
+
+        lines = []
+        if reloaded:
+            lines.append("✅ PULSE reloaded:")
+            lines.extend(f"└ {item}" for item in reloaded)
+        if config_error:
+            lines.append(f"⚠️ Configuration is invalid, previous settings kept.\n{config_error}")
+        message = "\n".join(lines) or "✅ PULSE is already up to date."
+
+        await interaction.response.send_message(message, ephemeral=True)
+        logger.info(f"Reload triggered by {interaction.user.name}: {', '.join(reloaded) or 'no changes'}")
+
 # This is the required setup function for the cog
 async def setup(bot: commands.Bot) -> None:
     """Set up the Setup cog"""
@@ -5,20 +5,18 @@ from discord import app_commands
 from discord.ext import commands
 from datetime import datetime
 import logging
-from utils.constants import ROLE_HIERARCHY, APP_VERSION, BUILD_DATE, ABOUT_MESSAGE
-from utils.database import Database
+from utils.constants import APP_VERSION, BUILD_DATE, ABOUT_MESSAGE
 
 logger = logging.getLogger('PULSE.status')
 
 class StatusCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.db = Database()
-        self.start_time = datetime.now()
+        self.db = bot.db
 
     def get_uptime(self) -> str:
         """Calculate bot uptime"""
-        delta = datetime.now() - self.start_time
+        delta = datetime.now() - self.bot.start_time
         days = delta.days
         hours, remainder = divmod(delta.seconds, 3600)
         minutes, seconds = divmod(remainder, 60)
@@ -44,7 +42,7 @@ class StatusCog(commands.Cog):
             role_counts = {}
             total_members = 0
 
-            for level, roles in ROLE_HIERARCHY.items():
+            for level, roles in self.bot.config.settings.role_hierarchy.items():
                 for role_name in roles:
                     role = discord.utils.get(interaction.guild.roles, name=role_name)
                     if role:
@@ -0,0 +1,98 @@
+# utils/config.py
+
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional
+from .constants import CONFIG_FILE, DEFAULT_COOLDOWN, ROLE_HIERARCHY, RoleLevel
+
+logger = logging.getLogger('PULSE.config')
+
+@dataclass(frozen=True)
+class Settings:
+    """Immutable snapshot of the runtime configuration"""
+    default_cooldown: int
+    role_hierarchy: Dict[RoleLevel, List[str]]
+    authorized_roles: FrozenSet[str]
+
+    @classmethod
+    def build(cls, default_cooldown: int, role_hierarchy: Dict[RoleLevel, List[str]]) -> 'Settings':
+        """Create a snapshot and its derived role index"""
+        authorized_roles = frozenset(
+            role for level, roles in role_hierarchy.items()
+            if level != RoleLevel.RESTRICTED
+            for role in roles
+        )
+        return cls(default_cooldown, role_hierarchy, authorized_roles)
+
+class Config:
+    def __init__(self, path: str = CONFIG_FILE):
+        self.path = Path(path)
+        self._mtime: Optional[float] = None
+        self.settings = Settings.build(DEFAULT_COOLDOWN, ROLE_HIERARCHY)
+        try:
+            self.reload()
+        except ValueError as e:
+            logger.error(f"Invalid configuration in {self.path}, using defaults: {e}")
+
+    def _get_mtime(self) -> Optional[float]:
+        """Get the modification time of the config file, if it exists"""
+        try:
+            return self.path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+    def has_changed(self) -> bool:
+        """Check if the config file changed since it was last loaded"""
+        return self._get_mtime() != self._mtime
+
+    def _parse(self, data: Dict) -> Settings:
+        """Validate raw config data and build a snapshot from it"""
+        cooldown = data.get('default_cooldown', DEFAULT_COOLDOWN)
+        if not isinstance(cooldown, int) or isinstance(cooldown, bool) or cooldown < 0:
+            raise ValueError("default_cooldown must be a non-negative integer")
+
+        overrides = data.get('role_hierarchy', {})
+        if not isinstance(overrides, dict):
+            raise ValueError("role_hierarchy must be an object mapping role levels to role names")
+
+        hierarchy = dict(ROLE_HIERARCHY)
+        for level_name, roles in overrides.items():
+            try:
+                level = RoleLevel(level_name)
+            except ValueError:
+                raise ValueError(f"Unknown role level: {level_name}")
+            if not isinstance(roles, list) or not all(isinstance(r, str) for r in roles):
+                raise ValueError(f"Roles for {level_name} must be a list of names")
+            hierarchy[level] = list(roles)
+
+        return Settings.build(cooldown, hierarchy)
+
+    def reload(self) -> bool:
+        """Reload the config file, returns True if the settings were replaced"""
+        mtime = self._get_mtime()
+        # Record the mtime up front so a broken file is only reported once per edit
+        self._mtime = mtime
+        if mtime is None:
+            data = {}
+        else:
+            try:
+                with open(self.path, encoding='utf-8') as f:
+                    data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Failed to parse {self.path}: {e}")
+            except OSError as e:
+                raise ValueError(f"Failed to read {self.path}: {e}")
+            if not isinstance(data, dict):
+                raise ValueError(f"{self.path} must contain a JSON object")
+
+        settings = self._parse(data)
+
+        if settings == self.settings:
+            return False
+
+        # Swap the whole snapshot at once so readers never see a partial update
+        self.settings = settings
+        logger.info(f"Configuration loaded from {self.path if mtime is not None else 'defaults'}")
+        return True
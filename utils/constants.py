@@ -45,6 +45,10 @@ DB_TABLES = {
 # Command cooldowns (in seconds)
 DEFAULT_COOLDOWN = 300  # 5 minutes
 
+# Runtime configuration (overrides the defaults above, reloaded without restart)
+CONFIG_FILE = "env/pulse.json"
+CONFIG_WATCH_INTERVAL = 5  # seconds between config/cog change checks
+
 # Logging configuration
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 LOG_FILE = "logs/pulse_bot.log"